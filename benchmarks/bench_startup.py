@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures cold start to first output of main.py and fails when it exceeds a budget
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(ROOT_DIR, "main.py")
+
+# Modules that must stay lazy: none of them are needed by --local
+LAZY_MODULES = ["requests", "dotenv", "groq", "src.ai_agents"]
+
+SAMPLE_HISTORY = "git status\ngit add main.py\ngit commit -m 'Update'\npython -m pytest\nmake build\n"
+
+def build_env(home_dir: str) -> Dict[str, str]:
+    """Build an environment whose home directory holds a fixed shell history"""
+    with open(os.path.join(home_dir, ".bash_history"), 'w', encoding='utf-8') as f:
+        f.write(SAMPLE_HISTORY)
+
+    ps_history_dir = os.path.join(home_dir, "AppData", "Roaming", "Microsoft",
+                                  "Windows", "PowerShell", "PSReadline")
+    os.makedirs(ps_history_dir, exist_ok=True)
+    with open(os.path.join(ps_history_dir, "ConsoleHost_history.txt"), 'w', encoding='utf-8') as f:
+        f.write(SAMPLE_HISTORY)
+
+    env = dict(os.environ)
+    env["HOME"] = home_dir
+    env["USERPROFILE"] = home_dir
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+def time_to_first_output(cli_args: List[str], env: Dict[str, str]) -> float:
+    """Run main.py once and return milliseconds until the first line of stdout"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, MAIN_SCRIPT] + cli_args, cwd=ROOT_DIR, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    first_line = process.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    process.communicate()
+
+    if not first_line or process.returncode != 0:
+        raise RuntimeError(f"main.py {' '.join(cli_args)} exited with code {process.returncode}")
+    return elapsed
+
+def collect_import_times(cli_args: List[str], env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    """Run main.py under -X importtime and return (module, self_us, cumulative_us) entries"""
+    result = subprocess.run([sys.executable, "-X", "importtime", MAIN_SCRIPT] + cli_args,
+                            cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        imports.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Startup time benchmark for main.py")
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                       help="Maximum median time to first output")
+    parser.add_argument("--import-budget-ms", type=float, default=80.0,
+                       help="Maximum total import time reported by -X importtime")
+    parser.add_argument("--runs", type=int, default=7,
+                       help="Number of timed runs")
+    parser.add_argument("--top", type=int, default=10,
+                       help="Number of slowest imports to show")
+    parser.add_argument("cli_args", nargs="*", default=["--local"],
+                       help="Arguments passed to main.py (default: --local)")
+
+    args = parser.parse_args()
+    failures = []
+
+    with tempfile.TemporaryDirectory() as home_dir:
+        env = build_env(home_dir)
+
+        try:
+            # Warm-up run writes bytecode and config caches, like any second invocation
+            time_to_first_output(args.cli_args, env)
+            timings = [time_to_first_output(args.cli_args, env) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            return 1
+        imports = collect_import_times(args.cli_args, env)
+
+    median_ms = statistics.median(timings)
+    import_ms = sum(self_us for _, self_us, _ in imports) / 1000
+
+    print("="*60)
+    print(f"STARTUP BENCHMARK: main.py {' '.join(args.cli_args)}")
+    print("="*60)
+    print(f"Time to first output: median {median_ms:.1f} ms, "
+          f"min {min(timings):.1f} ms, max {max(timings):.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Total import time: {import_ms:.1f} ms (budget {args.import_budget_ms:.0f} ms)")
+
+    print("\n" + "-"*40)
+    print("SLOWEST IMPORTS (cumulative)")
+    print("-"*40)
+    for name, _, cumulative_us in sorted(imports, key=lambda item: item[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:8.1f} ms  {name}")
+
+    if median_ms > args.budget_ms:
+        failures.append(f"time to first output {median_ms:.1f} ms exceeds {args.budget_ms:.0f} ms")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import time {import_ms:.1f} ms exceeds {args.import_budget_ms:.0f} ms")
+
+    if "--local" in args.cli_args:
+        imported = {name for name, _, _ in imports}
+        for module in LAZY_MODULES:
+            if module in imported:
+                failures.append(f"{module} is imported on the --local path")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\nOK")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
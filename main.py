@@ -6,49 +6,76 @@ Main application that coordinates the primary and secondary agents
 
 import os
 import sys
-import json
 import argparse
 import logging
-from dotenv import load_dotenv
 from src.history_capture import HistoryCapture
-from src.ai_agents import PrimaryAgent, SecondaryAgent
 from src.utils import ConfigManager, OutputManager
 
+# dotenv, requests and the AI agents are imported on first use so that
+# paths which never reach the network (--local, early errors) start fast.
+
 class TerminalAnalyzer:
     """Main application class that coordinates the AI agents"""
     
-    def __init__(self, config_path: str = "config/config.json"):
-        # Load environment variables
-        load_dotenv(".env")
-        
+    def __init__(self, config_path: str = "config/config.json", local: bool = False,
+                 use_config_cache: bool = True):
         # Setup logging
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
         
         # Load configuration
-        self.config = ConfigManager.load_config(config_path)
+        self.config = ConfigManager.load_config(config_path, use_cache=use_config_cache)
         
         # Validate configuration
         if not ConfigManager.validate_config(self.config):
             self.logger.error("Invalid configuration. Please check your config.json file.")
             sys.exit(1)
         
-        # Check Groq API key
-        if not os.getenv("GROQ_API_KEY"):
-            self.logger.error("GROQ_API_KEY not found in environment variables.")
-            self.logger.error("Please set your Groq API key in the .env file.")
-            sys.exit(1)
-        
-        self.logger.info("✅ Groq API configured successfully")
-        
-        # Initialize components
+        # Local mode only reads history, so the API key is not required
+        if not local:
+            # Load environment variables
+            from dotenv import load_dotenv
+            load_dotenv(".env")
+            
+            # Check Groq API key
+            if not os.getenv("GROQ_API_KEY"):
+                self.logger.error("GROQ_API_KEY not found in environment variables.")
+                self.logger.error("Please set your Groq API key in the .env file.")
+                sys.exit(1)
+            
+            self.logger.info("✅ Groq API configured successfully")
+        
+        # Initialize components; agents and output manager are created on first use
         self.history_capture = HistoryCapture(
             max_commands=self.config["history"]["max_commands"]
         )
         
-        self.primary_agent = PrimaryAgent(self.config["primary_agent"])
-        self.secondary_agent = SecondaryAgent(self.config["secondary_agent"])
-        self.output_manager = OutputManager(self.config["output"])
+        self._primary_agent = None
+        self._secondary_agent = None
+        self._output_manager = None
+    
+    @property
+    def primary_agent(self):
+        """Primary agent, created on first access"""
+        if self._primary_agent is None:
+            from src.ai_agents import PrimaryAgent
+            self._primary_agent = PrimaryAgent(self.config["primary_agent"])
+        return self._primary_agent
+    
+    @property
+    def secondary_agent(self):
+        """Secondary agent, created on first access"""
+        if self._secondary_agent is None:
+            from src.ai_agents import SecondaryAgent
+            self._secondary_agent = SecondaryAgent(self.config["secondary_agent"])
+        return self._secondary_agent
+    
+    @property
+    def output_manager(self):
+        """Output manager, created on first access"""
+        if self._output_manager is None:
+            self._output_manager = OutputManager(self.config["output"])
+        return self._output_manager
     
     def analyze_commands(self) -> dict:
         """
@@ -109,6 +136,7 @@ class TerminalAnalyzer:
             return 1
         
         if output_format.lower() == "json":
+            import json
             print(json.dumps(result, indent=2))
         else:
             self.output_manager.print_formatted_output(result)
@@ -119,6 +147,24 @@ class TerminalAnalyzer:
                 print(f"\nPredictions saved to: {filepath}")
         
         return 0
+    
+    def run_local(self, output_format: str = "console"):
+        """Print the captured command history without calling the AI agents"""
+        commands = self.history_capture.get_last_commands(
+            ignore_patterns=self.config["history"]["ignore_patterns"]
+        )
+        
+        if not commands:
+            print("Error: No commands found in history")
+            return 1
+        
+        if output_format.lower() == "json":
+            import json
+            print(json.dumps(commands, indent=2))
+        else:
+            print(self.history_capture.format_commands_for_analysis(commands), end="")
+        
+        return 0
 
 def main():
     """Main entry point"""
@@ -127,6 +173,10 @@ def main():
                        help="Path to configuration file")
     parser.add_argument("--output-format", choices=["console", "json"], default="console",
                        help="Output format")
+    parser.add_argument("--local", action="store_true",
+                       help="Only show captured command history (no API calls)")
+    parser.add_argument("--no-config-cache", action="store_true",
+                       help="Always re-parse the configuration file")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Enable verbose logging")
     
@@ -136,9 +186,13 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
-        analyzer = TerminalAnalyzer(config_path=args.config)
+        analyzer = TerminalAnalyzer(config_path=args.config, local=args.local,
+                                    use_config_cache=not args.no_config_cache)
         
-        exit_code = analyzer.run_once(output_format=args.output_format)
+        if args.local:
+            exit_code = analyzer.run_local(output_format=args.output_format)
+        else:
+            exit_code = analyzer.run_once(output_format=args.output_format)
         sys.exit(exit_code)
     
     except Exception as e:
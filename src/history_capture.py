@@ -1,7 +1,5 @@
 import os
-import json
-import subprocess
-import platform
+import sys
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
@@ -10,7 +8,8 @@ class HistoryCapture:
     
     def __init__(self, max_commands: int = 5):
         self.max_commands = max_commands
-        self.platform = platform.system().lower()
+        # sys.platform avoids importing the platform module at startup
+        self.platform = "windows" if sys.platform == "win32" else sys.platform
     
     def get_last_commands(self, ignore_patterns: List[str] = None) -> List[Dict]:
         """
@@ -61,6 +60,7 @@ class HistoryCapture:
             # Fallback: try to get from doskey if PowerShell history is not available
             if not commands:
                 try:
+                    import subprocess
                     result = subprocess.run(['doskey', '/history'], 
                                           capture_output=True, text=True, shell=True)
                     if result.returncode == 0:
@@ -124,6 +124,7 @@ class HistoryCapture:
             # Fallback: use history command
             if not commands:
                 try:
+                    import subprocess
                     result = subprocess.run(['history'], 
                                           capture_output=True, text=True, shell=True)
                     if result.returncode == 0:
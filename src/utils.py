@@ -1,6 +1,6 @@
 import os
-import json
-from typing import Dict, Any
+import marshal
+from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
 
@@ -12,10 +12,6 @@ class OutputManager:
         self.output_dir = config.get("output_directory", "outputs")
         self.save_to_file = config.get("save_to_file", True)
         self.include_raw_commands = config.get("include_raw_commands", False)
-        
-        # Create output directory if it doesn't exist
-        if self.save_to_file:
-            os.makedirs(self.output_dir, exist_ok=True)
     
     def format_analysis_output(self, commands: list, summary: str, predictions: str) -> Dict[str, Any]:
         """Format the complete analysis output"""
@@ -60,10 +56,14 @@ class OutputManager:
         if not self.save_to_file:
             return ""
         
+        import json
+        
         filename = f"analysis_{output['session_id']}.json"
         filepath = os.path.join(self.output_dir, filename)
         
         try:
+            # Create output directory only when something is actually saved
+            os.makedirs(self.output_dir, exist_ok=True)
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(output, f, indent=2, ensure_ascii=False)
             return filepath
@@ -105,18 +105,75 @@ class OutputManager:
 class ConfigManager:
     """Manages configuration loading and validation"""
     
+    # Bump when the cache file layout changes
+    CACHE_VERSION = 1
+    
     @staticmethod
-    def load_config(config_path: str = "config.json") -> Dict[str, Any]:
-        """Load configuration from JSON file"""
+    def load_config(config_path: str = "config.json", use_cache: bool = True) -> Dict[str, Any]:
+        """Load configuration from JSON file, reusing a cached parse when it is up to date"""
+        if use_cache:
+            config = ConfigManager._load_cached_config(config_path)
+            if config is not None:
+                return config
+        
+        import json
+        
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
         except FileNotFoundError:
             print(f"Config file {config_path} not found. Using defaults.")
             return ConfigManager.get_default_config()
         except json.JSONDecodeError as e:
             print(f"Error parsing config file: {e}. Using defaults.")
             return ConfigManager.get_default_config()
+        
+        if use_cache:
+            ConfigManager._save_cached_config(config_path, config)
+        return config
+    
+    @staticmethod
+    def get_cache_path(config_path: str) -> str:
+        """Get the cache file path for a config file (kept in a sibling __pycache__ directory)"""
+        directory, filename = os.path.split(os.path.abspath(config_path))
+        return os.path.join(directory, "__pycache__", f"{filename}.cache")
+    
+    @staticmethod
+    def _cache_key(config_path: str) -> tuple:
+        """Build the cache key from the config file's version, mtime and size"""
+        stat = os.stat(config_path)
+        return (ConfigManager.CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    @staticmethod
+    def _load_cached_config(config_path: str) -> Optional[Dict[str, Any]]:
+        """Load the marshalled config if the cache matches the current config file"""
+        try:
+            key = ConfigManager._cache_key(config_path)
+            with open(ConfigManager.get_cache_path(config_path), 'rb') as f:
+                cached_key, config = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        
+        if cached_key != key or not isinstance(config, dict):
+            return None
+        return config
+    
+    @staticmethod
+    def _save_cached_config(config_path: str, config: Dict[str, Any]):
+        """Write the parsed config to the cache; failures only cost the next startup"""
+        cache_path = ConfigManager.get_cache_path(config_path)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                marshal.dump((ConfigManager._cache_key(config_path), config), f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError) as e:
+            logging.debug(f"Could not write config cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
     
     @staticmethod
     def get_default_config() -> Dict[str, Any]: